@@ -97,12 +97,13 @@ def demo(ctx):
 
 
 @task
-def test(ctx, profile=False):
+def test(ctx, profile=False, parallel=False):
     """Run tests suite"""
     header(test.__doc__)
     kwargs = build_args(
         "--benchmark-skip",
         "--profile" if profile else None,
+        "-n auto" if parallel else None,
     )
     with ctx.cd(ROOT):
         ctx.run("pytest {0}".format(kwargs), pty=True)
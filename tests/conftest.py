@@ -6,6 +6,9 @@ from flask.testing import FlaskClient
 
 import flask_restx as restx
 
+# Prime the JSON parser so its first use isn't billed to a test
+json.loads("{}")
+
 
 class TestClient(FlaskClient):
     # Borrowed from https://pythonadventures.wordpress.com/2016/03/06/detect-duplicate-keys-in-a-json-file/
@@ -46,6 +49,13 @@ class TestClient(FlaskClient):
 def app():
     app = Flask(__name__)
     app.test_client_class = TestClient
+    if hasattr(app, "json"):
+        # Flask >= 2.2 moved these settings onto the JSON provider
+        app.json.sort_keys = False
+        app.json.compact = True
+    else:
+        app.config["JSON_SORT_KEYS"] = False
+        app.config["JSONIFY_PRETTYPRINT_REGULAR"] = False
     yield app
 
 